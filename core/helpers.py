@@ -15,7 +15,7 @@ except ModuleNotFoundError:     # graceful fallback in non-notebook runs
 
 import re
 from pathlib import Path
-from typing import Dict, List, Tuple, Iterable
+from typing import Dict, List, Tuple, Iterable, Sequence
 from .loader import load_db, keys_for_reference
 from . import Phonemizer
 
@@ -24,16 +24,19 @@ from . import Phonemizer
 # private helpers                                                    #
 # ------------------------------------------------------------------ #
 
+# Case-insensitive, like TAG_RE in the renderer below
 _TAG_RE   = re.compile(r"</?rule[^>]*?>", re.IGNORECASE | re.DOTALL)
 
 def _strip_rule_tags(text: str) -> str:
     """Remove <rule …> wrappers, keep interior letters unchanged."""
+    if "<" not in text:                  # untagged words need no regex pass
+        return text
     return _TAG_RE.sub("", text)
 
 def _ayah_end(num: int) -> str:
     """Return Qurʾānic verse-end marker with embedded number."""
     ARABIC_DIGITS = "٠١٢٣٤٥٦٧٨٩"
-    num = "".join(ARABIC_DIGITS[int(d)] for d in str(num))
+    num = "".join([ARABIC_DIGITS[int(d)] for d in str(num)])
     RLM = "\u200F"                       # right-to-left mark
     return f"{RLM}﴿{num}﴾{RLM}"
 
@@ -130,7 +133,7 @@ def display_verses_with_codepoints(
         if targets.issubset({ord(ch) for w in words for ch in w})
     ]
 
-    header = f"<h3>{len(matches)} verse(s) contain {' & '.join('U+'+c.upper() for c in codepoints)}</h3>"
+    header = f"<h3>{len(matches)} verse(s) contain {' & '.join(['U+'+c.upper() for c in codepoints])}</h3>"
     if ref:
         header += f"<p>Search restricted to <code>{ref}</code></p>"
     display(HTML(header))
@@ -262,7 +265,7 @@ def phonemize_and_save(
     output_path: str | Path,
     *,
     db_path: str | Path = "resources/Quran.json",
-    stops: List[str] = [],
+    stops: Sequence[str] = (),
 ) -> None:
     """
     Phonemize a given reference and save the formatted output to a file.
@@ -280,7 +283,7 @@ def phonemize_and_save(
         Full path to save the phonemized output file
     db_path : str | Path
         Path to the Qurʾān word-by-word JSON.
-    stops : List[str]
+    stops : Sequence[str]
         List of stop types to mark as boundaries.
     """
     # Import here to avoid circular imports
@@ -303,7 +306,7 @@ def phonemize_and_save(
     def visual_width(text):
         """Calculate visual width by removing combining characters (diacritics)"""
         import unicodedata
-        return len(''.join(c for c in text if not unicodedata.combining(c)))
+        return len(''.join([c for c in text if not unicodedata.combining(c)]))
     
     def align_at_column(word, phoneme_str, target_col=20):
         """Align phoneme string to start at target column"""
@@ -340,7 +343,7 @@ def phonemize_and_save(
             
         if phoneme_index < len(phoneme_arrays):
             phoneme_array = phoneme_arrays[phoneme_index]
-            phoneme_str = "[" + ", ".join(f"'{p}'" for p in phoneme_array) + "]"
+            phoneme_str = "[" + ", ".join([f"'{p}'" for p in phoneme_array]) + "]"
             aligned_line = align_at_column(clean_word, phoneme_str)
             output_lines.append(aligned_line)
             phoneme_index += 1
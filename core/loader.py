@@ -17,17 +17,78 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Tuple
+
+import yaml
+
+from .location import Location
+
+try:                                   # libyaml-backed parser when available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:                    # pure-Python fallback
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+try:                                   # optional, faster JSON parser
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# resolved path -> (mtime_ns, parsed DB, key -> Location); see load_db()
+_db_cache: Dict[str, Tuple[int, Dict[str, dict], Dict[str, Location]]] = {}
 
 
 # ----------------------------------------------------------------------
-# JSON loading
+# JSON / YAML loading
 # ----------------------------------------------------------------------
 
+def _load_db_cached(db_path: str | Path) -> Tuple[int, Dict[str, dict], Dict[str, Location]]:
+    """Parse *db_path* once per mtime; returns the :data:`_db_cache` record."""
+    path = Path(db_path).expanduser().resolve()
+    mtime = path.stat().st_mtime_ns
+    cached = _db_cache.get(str(path))
+    if cached is not None and cached[0] == mtime:
+        return cached
+
+    raw = path.read_bytes()
+    db = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    for entry in db.values():
+        text = entry["text"]
+        if isinstance(text, list):
+            entry["text"] = "".join(text)
+    locations = {key: Location.from_key(key) for key in db}
+    cached = _db_cache[str(path)] = (mtime, db, locations)
+    return cached
+
+
 def load_db(db_path: str | Path) -> Dict[str, dict]:
-    """Read the Qurʾān word-by-word database into a dict."""
-    with Path(db_path).expanduser().open(encoding="utf-8") as fh:
-        return json.load(fh)
+    """
+    Read the Qurʾān word-by-word database into a dict.
+
+    The file is parsed once per process (and again only if its mtime
+    changes); every caller shares the same dict, so treat it as read-only.
+    List-valued ``"text"`` fields are joined, so per-call code can skip it.
+    """
+    return _load_db_cached(db_path)[1]
+
+
+def load_locations(db_path: str | Path) -> Dict[str, Location]:
+    """
+    Pre-built :class:`Location` for every key of :func:`load_db`.
+
+    Cached alongside the DB (same mtime check) and shared, so treat it as
+    read-only.
+    """
+    return _load_db_cached(db_path)[2]
+
+
+def clear_db_cache() -> None:
+    """Forget every DB parsed by :func:`load_db`."""
+    _db_cache.clear()
+
+
+def load_yaml(yaml_path: str | Path) -> Any:
+    """Safe-load a YAML resource, using the C loader when libyaml is present."""
+    return yaml.load(Path(yaml_path).expanduser().read_bytes(), Loader=_YamlLoader)
 
 
 # ----------------------------------------------------------------------
@@ -5,6 +5,7 @@ Location class for the Quranic phonemizer.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass(frozen=True)
@@ -25,3 +26,13 @@ class Location:
             word_num=int(parts[2]),
             location_key=key
         )
+
+    @cached_property
+    def verse_key(self) -> str:
+        """The 'surah:ayah' key of the verse this location belongs to."""
+        return f"{self.surah_num}:{self.ayah_num}"
+
+    @cached_property
+    def sort_key(self) -> int:
+        """Single int ordering locations like (surah, ayah, word) tuples."""
+        return (self.surah_num << 24) | (self.ayah_num << 12) | self.word_num
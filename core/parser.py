@@ -4,15 +4,16 @@ Parser for the Quranic phonemizer.
 
 from __future__ import annotations
 
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from typing import Collection, List, Dict, Any, Optional
 from pathlib import Path
-import yaml
 import json
-import re
+import sys
 
-from .loader import load_db, keys_for_reference
+from .loader import load_db, load_locations, load_yaml, keys_for_reference
 from .location import Location
-from .word import Word
+from .text import strip_rule_tags
+from .word import Word, link_words
 from .symbols.letters.letter import LetterSymbol
 from .symbols.diacritic import DiacriticSymbol
 from .symbols.extension import ExtensionSymbol
@@ -54,6 +55,16 @@ LETTER_CLASSES: dict[str, type[LetterSymbol]] = {
     "ۧ":  Yaa, # mini yaa
 }
 
+# Symbol categories used by Parser.char_table
+_LETTER, _DIACRITIC, _EXTENSION, _SHADDA, _OTHER, _STOP = range(6)
+_SHADDA_CHAR = "ّ"
+
+
+def _resolve_path(path: str | Path) -> str:
+    """Canonical string form of *path*, used as a cache key."""
+    return str(Path(path).expanduser().resolve())
+
+
 def _load_special_words(yaml_path: str | Path) -> Dict[str, List[str]]:
     """
     Load special words and their phonemes from YAML file.
@@ -66,10 +77,15 @@ def _load_special_words(yaml_path: str | Path) -> Dict[str, List[str]]:
     Returns
     -------
     Dict[str, List[str]]
-        Dictionary mapping location keys to phoneme lists
+        Dictionary mapping location keys to phoneme lists. The dict is
+        cached per file and shared between parsers; treat it as read-only.
     """
-    with open(yaml_path, 'r', encoding='utf-8') as file:
-        data = yaml.safe_load(file)
+    return _load_special_words_cached(_resolve_path(yaml_path))
+
+
+@lru_cache(maxsize=4)
+def _load_special_words_cached(yaml_path: str) -> Dict[str, List[str]]:
+    data = load_yaml(yaml_path)
     
     special_words_map = {}
     
@@ -110,28 +126,56 @@ class Parser:
         self.symbol_mappings = symbol_mappings
         self.special_words_map = _load_special_words(special_words_path)
         self._build_lookup_tables()
+        # Per-parser memo of text -> scanned symbols; bounded by the DB vocabulary
+        self._scan_cache: Dict[str, tuple] = {}
     
     def _build_lookup_tables(self) -> None:
         """Build lookup tables for efficient symbol identification."""
         self.letter_map = {}
-        for letter_type, letter_info in self.symbol_mappings.get("letters", {}).items():
-            self.letter_map[letter_info["char"]] = (letter_type, letter_info)
-        
         self.diacritic_map = {}
-        for diacritic_type, diacritic_info in self.symbol_mappings.get("diacritics", {}).items():
-            self.diacritic_map[diacritic_info["char"]] = (diacritic_type, diacritic_info)
-        
         self.extension_map = {}
-        for extension_type, extension_info in self.symbol_mappings.get("extensions", {}).items():
-            self.extension_map[extension_info["char"]] = (extension_type, extension_info)
-        
         self.stop_sign_map = {}
-        for stop_type, stop_info in self.symbol_mappings.get("stop_signs", {}).items():
-            self.stop_sign_map[stop_info["char"]] = (stop_type, stop_info)
-        
         self.other_map = {}
-        for other_type, other_info in self.symbol_mappings.get("other", {}).items():
-            self.other_map[other_info["char"]] = (other_type, other_info)
+
+        # Single char -> (category, type, phoneme, symbol) table used by
+        # parse_word, so each character costs one lookup instead of a cascade
+        # over the maps above. Keys are the raw mapping chars, matching the
+        # (unnormalised) word text. Non-letter symbols are never mutated, so
+        # one instance per mapping entry is built here and shared; letters are
+        # built per word.
+        # A single table can only give each char one category, whereas the
+        # old per-map cascade resolved a shared char differently at the start
+        # of a letter and in its lookahead, so chars must be unique across
+        # sections (only shaddah may also appear under "other").
+        self.char_table: Dict[str, tuple] = {}
+        char_sections: Dict[str, str] = {}
+        for section, category, mapping, symbol_class, default_phoneme in (
+            ("other", _OTHER, self.other_map, OtherSymbol, None),
+            ("extensions", _EXTENSION, self.extension_map, ExtensionSymbol, None),
+            ("diacritics", _DIACRITIC, self.diacritic_map, DiacriticSymbol, None),
+            ("letters", _LETTER, self.letter_map, None, ""),
+            ("stop_signs", _STOP, self.stop_sign_map, StopSymbol, ""),
+        ):
+            for symbol_type, info in self.symbol_mappings.get(section, {}).items():
+                char = info["char"]
+                other_section = char_sections.setdefault(char, section)
+                if other_section != section:
+                    raise ValueError(
+                        f"Symbol char {char!r} ({symbol_type}) is mapped in both "
+                        f"'{other_section}' and '{section}'"
+                    )
+                mapping[char] = (symbol_type, info)
+                phoneme = info.get("phoneme", default_phoneme)
+                symbol = None
+                if symbol_class is not None:
+                    symbol = symbol_class(symbol_type, char, phoneme)
+                self.char_table[char] = (category, symbol_type, phoneme, symbol)
+        if char_sections.get(_SHADDA_CHAR, "other") != "other":
+            raise ValueError(
+                f"Shaddah char {_SHADDA_CHAR!r} may only be mapped under 'other', "
+                f"not '{char_sections[_SHADDA_CHAR]}'"
+            )
+        self.char_table[_SHADDA_CHAR] = (_SHADDA, "SHADDA", None, None)
     
     def parse_word(self, text: str, location: Location) -> Word:
         """Parse a word text into a Word object with properly associated symbols."""
@@ -143,138 +187,155 @@ class Parser:
             word.phonemes = special_phonemes
             return word
         
+        # Letters are mutated during phonemization, so build fresh ones from
+        # the (cached) scan of this text every time
+        stop_sign, letter_specs = self._scan_symbols(text)
+        word.stop_sign = stop_sign
+        append_letter = word.letters.append
+        for index, (letter_class, letter_type, char, phoneme, diacritic, extension, has_shaddah, other_symbols) in enumerate(letter_specs):
+            letter = letter_class(letter_type, char, phoneme)
+            letter.diacritic = diacritic
+            letter.extension = extension
+            letter.has_shaddah = has_shaddah
+            letter.other_symbols = list(other_symbols)
+            
+            # Set parent references
+            letter.parent_word = word
+            letter.index_in_word = index
+            append_letter(letter)
+        
+        return word
+    
+    def _scan_symbols(self, text: str) -> tuple:
+        """
+        Scan *text* into ``(stop_sign, letter_specs)``.
+
+        Each letter spec is ``(letter_class, type, char, phoneme, diacritic,
+        extension, has_shaddah, other_symbols)``. The result depends only on
+        the text, so it is memoised per parser (see ``__init__``); the symbol
+        objects inside it are shared between words and must not be mutated.
+        """
+        cached = self._scan_cache.get(text)
+        if cached is not None:
+            return cached
+
         # Strip rule tags for character processing
-        stripped_text = self._strip_rule_tags(text)
+        stripped_text = strip_rule_tags(text)
+        
+        stop_sign: Optional[StopSymbol] = None
+        letter_specs: List[list] = []
         
         # Parse symbols with proper association
+        char_table = self.char_table
+        n = len(stripped_text)
         i = 0
-        while i < len(stripped_text):
+        while i < n:
             char = stripped_text[i]
-            
-            # Skip whitespace
-            if char.isspace():
-                i += 1
-                continue
+            entry = char_table.get(char)
+            category = entry[0] if entry else None
             
             # Check if it's a stop sign
-            if char in self.stop_sign_map:
-                stop_type, stop_info = self.stop_sign_map[char]
-                symbol = StopSymbol(stop_type, char, stop_info.get("phoneme", ""))
-                word.stop_sign = symbol
+            if category == _STOP:
+                stop_sign = entry[3]
                 i += 1
                 continue
             
             # Check if it's a letter
-            if char in self.letter_map:
-                letter_type, letter_info = self.letter_map[char]
+            if category == _LETTER:
+                _, letter_type, letter_phoneme, _ = entry
                 letter_class = LETTER_CLASSES.get(char, LetterSymbol)
-                letter = letter_class(letter_type, char, letter_info.get("phoneme", ""))
+                diacritic = extension = None
+                has_shaddah = False
+                other_symbols: List[OtherSymbol] = []
                 
                 # Look ahead for associated diacritics, extensions, and shaddah
                 j = i + 1
-                while j < len(stripped_text):
+                while j < n:
                     next_char = stripped_text[j]
+                    next_entry = char_table.get(next_char)
+                    if next_entry is None:
+                        break
+                    next_category, _, _, next_symbol = next_entry
                     
                     # Check for diacritics
-                    if next_char in self.diacritic_map:
-                        diacritic_type, diacritic_info = self.diacritic_map[next_char]
-                        diacritic = DiacriticSymbol(diacritic_type, next_char, diacritic_info.get("phoneme"))
-                        letter.diacritic = diacritic
-                        j += 1
-                        continue
+                    if next_category == _DIACRITIC:
+                        diacritic = next_symbol
                     
                     # Check for extensions
-                    elif next_char in self.extension_map:
-                        extension_type, extension_info = self.extension_map[next_char]
-                        extension = ExtensionSymbol(extension_type, next_char, extension_info.get("phoneme"))
-                        letter.extension = extension
-                        j += 1
-                        continue
+                    elif next_category == _EXTENSION:
+                        extension = next_symbol
                     
                     # Check for shaddah
-                    elif next_char == "ّ":
-                        letter.has_shaddah = True
-                        j += 1
-                        continue
+                    elif next_category == _SHADDA:
+                        has_shaddah = True
                     
                     # Check for other symbols that should be associated with this letter
-                    elif next_char in self.other_map:
-                        other_type, other_info = self.other_map[next_char]
-                        other = OtherSymbol(other_type, next_char, other_info.get("phoneme"))
-                        letter.other_symbols.append(other)
-                        j += 1
-                        continue
+                    elif next_category == _OTHER:
+                        other_symbols.append(next_symbol)
                     
                     # If it's not an associated symbol, break the loop
                     else:
                         break
+                    j += 1
                 
-                # Set parent references
-                letter.parent_word = word
-                letter.index_in_word = len(word.letters)
-                word.letters.append(letter)
+                letter_specs.append([
+                    letter_class, letter_type, sys.intern(char), letter_phoneme,
+                    diacritic, extension, has_shaddah, other_symbols,
+                ])
                 
                 # Update i to j to skip processed characters
                 i = j
                 continue
             
+            # Skip whitespace (never a mapped symbol, so only checked on a miss)
+            if entry is None and char.isspace():
+                i += 1
+                continue
+            
             # If we get here, it's an unknown symbol - treat as other
-            other = OtherSymbol("UNKNOWN", char, None)
-            # Associate with the previous letter if it exists
-            if word.letters:
-                letter = word.letters[-1]
-                letter.other_symbols.append(other)
+            # and associate with the previous letter if it exists
+            if letter_specs:
+                letter_specs[-1][7].append(OtherSymbol("UNKNOWN", char, None))
 
             i += 1
         
-        return word
+        result = stop_sign, tuple(
+            (*spec[:7], tuple(spec[7])) for spec in letter_specs
+        )
+        self._scan_cache[text] = result
+        return result
     
-    def _strip_rule_tags(self, text: str) -> str:
-        """Remove rule tags from text for character processing."""
-        stripped_text = re.sub(r"<rule class=[^>]+>", "", text)
-        stripped_text = re.sub(r"</rule>", "", stripped_text)
-        return stripped_text
-    
-    def load_words(self, ref: str, db_path: str | Path = DATA_DIR / "Quran.json", *, stop_types: List[str] = []) -> List[Word]:
+    def load_words(self, ref: str, db_path: str | Path = DATA_DIR / "Quran.json", *, stop_types: Collection[str] = ()) -> List[Word]:
         """Load words for a reference range and annotate boundaries."""
         db = load_db(db_path)
+        location_map = load_locations(db_path)
         locations = keys_for_reference(ref, db)
         words: List[Word] = []
 
         for loc in locations:
-            raw = db[loc]["text"]
-            location_obj = Location.from_key(loc)
-            word = self.parse_word(raw, location_obj)
+            word = self.parse_word(db[loc]["text"], location_map[loc])
             words.append(word)
 
-        self._link_words(words)
+        link_words(words)
         self._annotate_boundaries(words, stop_types=stop_types)
         return words
     
-    def _link_words(self, words: List[Word]) -> None:
-        """Link words with references to previous and next words."""
-        for i, word in enumerate(words):
-            if i > 0:
-                word.prev_word = words[i - 1]
-            if i < len(words) - 1:
-                word.next_word = words[i + 1]
-    
-    def _annotate_boundaries(self, words: List[Word], *, stop_types: List[str]) -> None:
+    def _annotate_boundaries(self, words: List[Word], *, stop_types: Collection[str]) -> None:
         """Set is_starting / is_stopping flags on each word.
 
         Parameters
         ----------
         words : List[Word]
             Sequence of words.
-        stop_types : list[str]
+        stop_types : Collection[str]
             Stop sign types that should be treated as hard boundaries. If empty, no stop signs count.
         """
         words[0].is_starting = True
         words[-1].is_stopping = True
 
-        stop_types = [s.lower() for s in stop_types]
+        stop_types = frozenset(s.lower() for s in stop_types)
 
-        for idx, word in enumerate(words):
+        for word in words:
             # Stop-sign logic
             if word.stop_sign and word.stop_sign.name.lower() in stop_types:
                 word.is_stopping = True
@@ -282,7 +343,7 @@ class Parser:
                     word.next_word.is_starting = True
 
         if "verse" in stop_types:
-            for idx, word in enumerate(words):
+            for word in words:
                 prev_word = word.prev_word
                 next_word = word.next_word
                 # Start of verse
@@ -294,6 +355,10 @@ class Parser:
 
 
 def load_symbol_mappings(map_path: str | Path = DATA_DIR / "base_phonemes.yaml") -> Dict[str, Any]:
-    """Load symbol mappings from YAML file."""
-    with Path(map_path).expanduser().open(encoding="utf-8") as fh:
-        return yaml.safe_load(fh)
+    """Load symbol mappings from YAML file (cached per file; treat as read-only)."""
+    return _load_symbol_mappings_cached(_resolve_path(map_path))
+
+
+@lru_cache(maxsize=4)
+def _load_symbol_mappings_cached(map_path: str) -> Dict[str, Any]:
+    return load_yaml(map_path)
@@ -4,9 +4,11 @@ fast lookup of phonemes by Arabic character or rule key.
 """
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
-import yaml
+
+from .loader import load_yaml
 
 # We keep the resources beside core package
 DATA_DIR = Path(__file__).resolve().parent.parent / "resources"
@@ -25,8 +27,7 @@ def _init() -> None:
     rule_path = DATA_DIR / "rule_phonemes.yaml"
 
     if base_path.exists():
-        with base_path.open("r", encoding="utf-8") as fh:
-            base_data = yaml.safe_load(fh)
+        base_data = load_yaml(base_path)
         for letter_type, info in base_data.get("letters", {}).items():
             char = info.get("char")
             phoneme = info.get("phoneme", "")
@@ -36,8 +37,7 @@ def _init() -> None:
         raise FileNotFoundError(base_path)
 
     if rule_path.exists():
-        with rule_path.open("r", encoding="utf-8") as fh:
-            _RULE_CACHE = yaml.safe_load(fh) or {}
+        _RULE_CACHE = load_yaml(rule_path) or {}
     else:
         raise FileNotFoundError(rule_path)
 
@@ -51,9 +51,13 @@ def get_base_phoneme(char: str) -> str:
     return _BASE_CACHE.get(char, "")
 
 
+@lru_cache(maxsize=None)
 def get_rule_phoneme(rule: str, key: str = "phoneme", default: str = "") -> str:
     """Return a phoneme defined in rule_phonemes.yaml.
 
+    Lookups are memoised: the registry is read-only once loaded, so each
+    (rule, key) pair is resolved through the YAML sections only once.
+
     Example::
         get_rule_phoneme("ikhfaa", "light_phoneme")
     """
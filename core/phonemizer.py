@@ -1,17 +1,58 @@
 from __future__ import annotations
 
+import itertools
 import json
+import os
 import re
-from dataclasses import dataclass
-from typing import List, Literal
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
+from typing import List, Literal, Sequence, Tuple
 from pathlib import Path
 
 from .parser import Parser, load_symbol_mappings
-from .word import Word
+from .word import Word, link_words
+
+try:                                   # optional, faster JSON encoder
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 # Data directory
 DATA_DIR = Path(__file__).resolve().parent.parent / "resources"
 
+# Stop types accepted as boundaries by ``Phonemizer.phonemize``
+_VALID_STOPS = frozenset({
+    "verse",
+    "preferred_continue",
+    "preferred_stop",
+    "optional_stop",
+    "compulsory_stop",
+    "prohibited_stop",
+})
+
+# Well-formed "s[:v[:w]][-s[:v[:w]]]" references; anything else takes the
+# slower split-based path in Phonemizer._validate_refs for a precise error.
+_ENDPOINT = r"((\d+)(?::(\d*))?(?::(\d*))?)"
+_REF_RE = re.compile(rf"\s*{_ENDPOINT}\s*(?:-\s*{_ENDPOINT}\s*)?")
+
+# Western → Arabic-Indic digits for verse numbers in PhonemizeResult.text()
+_AR_DIGITS = str.maketrans("0123456789", "٠١٢٣٤٥٦٧٨٩")
+
+
+def _json_compact(value) -> str:
+    """Encode *value* as compact, non-ASCII-preserving JSON on one line."""
+    if orjson is not None:
+        return orjson.dumps(value).decode("utf-8")
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+@lru_cache(maxsize=4)
+def _load_surah_info(path: str) -> dict[str, dict]:
+    """Load surah_info.json (cached per file and shared; treat as read-only)."""
+    return json.loads(Path(path).read_bytes())
+
+
 class Phonemizer:
     def __init__(
         self,
@@ -21,25 +62,18 @@ class Phonemizer:
     ) -> None:
         self.db_path = str(db_path)
         self.map_path = str(map_path)
+        self.special_words_path = str(special_words_path)
         symbol_mappings = load_symbol_mappings(map_path)
         self.parser = Parser(symbol_mappings, special_words_path)
         # Load surah/verse/word boundaries for reference validation
-        with (DATA_DIR / "surah_info.json").open("r", encoding="utf-8") as fh:
-            self._surah_info: dict[str, dict] = json.load(fh)
-        self.valid_stops = {
-            "verse",
-            "preferred_continue",
-            "preferred_stop", 
-            "optional_stop",
-            "compulsory_stop",
-            "prohibited_stop",
-        }
+        self._surah_info = _load_surah_info(str((DATA_DIR / "surah_info.json").resolve()))
+        self.valid_stops = _VALID_STOPS
 
     def phonemize(
         self,
         ref: str,
         *,
-        stops: List[str] = [],
+        stops: Sequence[str] = (),
         debug: bool = False,
     ) -> PhonemizeResult:
         """
@@ -49,7 +83,7 @@ class Phonemizer:
         ----------
         ref : str
             Qurʾānic reference.
-        stops : List[str], default []
+        stops : Sequence[str], default ()
             List of stop types to mark as boundaries.
         debug : bool, default False
             Whether to print debug information.
@@ -59,24 +93,93 @@ class Phonemizer:
         PhonemizeResult
             Object containing reference, text and phonemes.
         """
+        stops = tuple(stops)
+
         # Validate reference against known bounds
         self._validate_refs(ref)
 
-        invalid_stops = set(stops) - self.valid_stops
-        if invalid_stops:
-            raise ValueError(f"Invalid stop types: {invalid_stops}. Valid stops are: {self.valid_stops}")
+        self._validate_stops(stops)
 
         words = self.parser.load_words(ref, self.db_path, stop_types=stops)
-        for word in words:
-            word.phonemize()
+        n_words = len(words)
+        if words:
+            words[0].phonemize()
 
+        text_parts = []
         all_phonemes = []
-        for word in words:
-            all_phonemes.append(word.get_phonemes())
+        for i, word in enumerate(words):
+            # Phonemizing the next word may still rewrite this word's last
+            # phonemes (never any earlier word's), so it runs before gathering.
+            if i + 1 < n_words:
+                words[i + 1].phonemize()
+            text_parts.append(word.clean_text())
+            all_phonemes.append(tuple(word.get_phonemes()))
             if debug:
                 print(word.debug_print())
 
-        return PhonemizeResult(ref, " ".join(w.text for w in words), all_phonemes, words, stops)
+        return PhonemizeResult(ref, " ".join(text_parts), tuple(all_phonemes), words, stops)
+
+    def phonemize_many(
+        self,
+        refs: Sequence[str],
+        *,
+        stops: Sequence[str] = (),
+        n_workers: int | None = None,
+        chunksize: int | None = None,
+    ) -> List[PhonemizeResult]:
+        """
+        Phonemize several independent references in parallel.
+
+        Each worker process builds its own Phonemizer once (same resource
+        paths as this instance) and reuses it for every reference it is
+        handed. Phonemization is pure Python and holds the GIL, so a thread
+        pool would not run references concurrently; processes are used instead.
+
+        Parameters
+        ----------
+        refs : Sequence[str]
+            Qurʾānic references, each accepted by :meth:`phonemize`.
+        stops : Sequence[str], default ()
+            List of stop types to mark as boundaries (shared by all refs).
+        n_workers : int | None, default None
+            Number of worker processes. ``None`` uses ``os.cpu_count()``;
+            ``1`` phonemizes serially in the current process.
+        chunksize : int | None, default None
+            Number of refs sent to a worker per task. ``None`` picks a size
+            that keeps every worker busy while amortising IPC (at most 64).
+
+        Returns
+        -------
+        List[PhonemizeResult]
+            One result per reference, in input order.
+        """
+        refs = list(refs)
+        n_workers = n_workers or os.cpu_count() or 1
+        if n_workers == 1 or len(refs) <= 1:
+            return [self.phonemize(ref, stops=stops) for ref in refs]
+
+        # Fail fast in the parent rather than inside a worker
+        for ref in refs:
+            self._validate_refs(ref)
+        self._validate_stops(stops)
+
+        if chunksize is None:
+            chunksize = max(1, min(64, len(refs) // (n_workers * 4)))
+
+        with ProcessPoolExecutor(
+            max_workers=min(n_workers, len(refs)),
+            initializer=_init_worker,
+            initargs=(self.db_path, self.map_path, self.special_words_path),
+        ) as executor:
+            results = list(executor.map(
+                _phonemize_in_worker, refs, itertools.repeat(list(stops)), chunksize=chunksize,
+            ))
+        return results
+
+    def _validate_stops(self, stops: Sequence[str]) -> None:
+        invalid_stops = [s for s in stops if s not in self.valid_stops]
+        if invalid_stops:
+            raise ValueError(f"Invalid stop types: {invalid_stops}. Valid stops are: {sorted(self.valid_stops)}")
 
     def _validate_refs(self, ref: str) -> None:
         ref = ref.strip()
@@ -94,10 +197,9 @@ class Phonemizer:
             return surah, verse, word
 
         def check_bounds(surah: int, verse: int | None, word: int | None) -> None:
-            s_key = str(surah)
-            if s_key not in self._surah_info:
+            s_info = self._surah_info.get(str(surah))
+            if s_info is None:
                 raise ValueError(f"Surah out of range: {surah}")
-            s_info = self._surah_info[s_key]
             if verse is not None:
                 if verse < 1 or verse > int(s_info["num_verses"]):
                     raise ValueError(f"Verse out of range: {surah}:{verse}")
@@ -107,30 +209,93 @@ class Phonemizer:
                     if word < 1 or word > max_words:
                         raise ValueError(f"Word out of range: {surah}:{verse}:{word} (max {max_words})")
 
-        if "-" in ref:
-            left, right = [p.strip() for p in ref.split("-", 1)]
-            s1, v1, w1 = parse_endpoint(left)
-            s2, v2, w2 = parse_endpoint(right)
-            check_bounds(s1, v1, w1)
-            check_bounds(s2, v2, w2)
+        def check_order(left: str, start: tuple, right: str, end: tuple) -> None:
             # Ensure ordering (start <= end) on (surah, verse, word); None treated as 0
             def norm(t: tuple[int, int | None, int | None]) -> tuple[int, int, int]:
                 a, b, c = t
                 return a, (b if b is not None else 0), (c if c is not None else 0)
-            if norm((s1, v1, w1)) > norm((s2, v2, w2)):
+            if norm(start) > norm(end):
                 raise ValueError(f"Invalid range: start '{left}' comes after end '{right}'")
+
+        m = _REF_RE.fullmatch(ref)
+        if m is not None:
+            left, s1, v1, w1, right, s2, v2, w2 = m.groups()
+            start = (int(s1), int(v1) if v1 else None, int(w1) if w1 else None)
+            check_bounds(*start)
+            if right is not None:
+                end = (int(s2), int(v2) if v2 else None, int(w2) if w2 else None)
+                check_bounds(*end)
+                check_order(left, start, right, end)
+            return
+
+        if "-" in ref:
+            left, right = [p.strip() for p in ref.split("-", 1)]
+            start = parse_endpoint(left)
+            end = parse_endpoint(right)
+            check_bounds(*start)
+            check_bounds(*end)
+            check_order(left, start, right, end)
         else:
-            s, v, w = parse_endpoint(ref)
-            check_bounds(s, v, w)
+            check_bounds(*parse_endpoint(ref))
 
 
-@dataclass(slots=True)
+# ------------------------------------------------------------------ #
+# process-pool workers for Phonemizer.phonemize_many                 #
+# ------------------------------------------------------------------ #
+
+_WORKER_PHONEMIZER: Phonemizer | None = None
+
+def _init_worker(db_path: str, map_path: str, special_words_path: str) -> None:
+    """Build the per-process Phonemizer used by :func:`_phonemize_in_worker`."""
+    global _WORKER_PHONEMIZER
+    _WORKER_PHONEMIZER = Phonemizer(db_path, map_path, special_words_path)
+
+def _phonemize_in_worker(ref: str, stops: Sequence[str]) -> PhonemizeResult:
+    return _WORKER_PHONEMIZER.phonemize(ref, stops=stops)
+
+
+def _verse_runs(words: Sequence[Word]) -> Tuple[Tuple[str, int, int], ...]:
+    """Split *words* into consecutive ``(verse_key, start, end)`` index runs."""
+    runs: list[tuple[str, int, int]] = []
+    start = 0
+    for i in range(1, len(words) + 1):
+        first = words[start].location
+        if i == len(words) or words[i].location.verse_key != first.verse_key:
+            runs.append((first.verse_key, start, i))
+            start = i
+    return tuple(runs)
+
+
+@dataclass(slots=True, frozen=True)
 class PhonemizeResult:
     ref: str
     _text: str                     
-    _nested: List[List[str]]       
+    _nested: Tuple[Tuple[str, ...], ...]
     _words: List[Word]
-    stops: List[str]
+    stops: Sequence[str]
+    _verse_runs: Tuple[Tuple[str, int, int], ...] = field(init=False, repr=False, compare=False)
+    _is_sorted: bool = field(init=False, repr=False, compare=False)
+    _str_cache: dict = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "_str_cache", {})
+        object.__setattr__(self, "_verse_runs", _verse_runs(self._words))
+        keys = [word.location.sort_key for word in self._words]
+        object.__setattr__(self, "_is_sorted", all(a <= b for a, b in zip(keys, keys[1:])))
+
+    def __setstate__(self, state: list) -> None:
+        # Mirrors the dataclass slots pickling (one value per field), then
+        # restores the neighbour links Word.__getstate__ drops
+        for f, value in zip(fields(self), state):
+            object.__setattr__(self, f.name, value)
+        link_words(self._words)
+
+    def _in_location_order(self) -> Tuple[Sequence[Word], Sequence[Tuple[str, ...]]]:
+        """Words and their phonemes sorted by location (as stored when already ordered)."""
+        if self._is_sorted:
+            return self._words, self._nested
+        order = sorted(range(len(self._words)), key=lambda i: self._words[i].location.sort_key)
+        return [self._words[i] for i in order], [self._nested[i] for i in order]
 
     # ---  convenience views  ---------------------------------
     def phonemes_list(self, split: Literal["word", "verse", "both"] = "word") -> list:
@@ -142,74 +307,30 @@ class PhonemizeResult:
         split="both":  List[List[List[str]]] — per verse, per word
         """
         if split == "word":
-            return self._nested
+            return [list(phonemes) for phonemes in self._nested]
 
         if split == "verse":
-            verses: list[list[str]] = []
-            current_verse_id: str | None = None
-            current_verse_phonemes: list[str] = []
-
-            for word in self._words:
-                verse_id = str(word.location.ayah_num)
-                if current_verse_id is None:
-                    current_verse_id = verse_id
-                if verse_id != current_verse_id:
-                    verses.append(current_verse_phonemes)
-                    current_verse_phonemes = []
-                    current_verse_id = verse_id
-                for ph in word.get_phonemes():
-                    current_verse_phonemes.append(str(ph))
-
-            if current_verse_phonemes:
-                verses.append(current_verse_phonemes)
-            return verses
+            return [
+                list(itertools.chain.from_iterable(self._nested[start:end]))
+                for _, start, end in self._verse_runs
+            ]
 
         if split == "both":
-            verses_words: list[list[list[str]]] = []
-            current_verse_id: str | None = None
-            current_words_in_verse: list[list[str]] = []
-
-            for word in self._words:
-                verse_id = str(word.location.ayah_num)
-                if current_verse_id is None:
-                    current_verse_id = verse_id
-                if verse_id != current_verse_id:
-                    verses_words.append(current_words_in_verse)
-                    current_words_in_verse = []
-                    current_verse_id = verse_id
-                current_word_ph = [str(p) for p in word.get_phonemes()]
-                current_words_in_verse.append(current_word_ph)
-
-            if current_words_in_verse:
-                verses_words.append(current_words_in_verse)
-            return verses_words
+            return [
+                [list(phonemes) for phonemes in self._nested[start:end]]
+                for _, start, end in self._verse_runs
+            ]
 
         raise ValueError("split must be one of: 'word', 'verse', 'both'")
 
     def text(self) -> str:
         """Return the full text with Arabic verse numbers like (١) between verses."""
         parts: list[str] = []
-        prev_verse: str | None = None
-        for word in self._words:
-            cur_verse = str(word.location.ayah_num)
-            if prev_verse is not None and cur_verse != prev_verse:
-                # Insert Arabic-indic verse number in parentheses
-                arabic_digits = {
-                    '0': '٠', '1': '١', '2': '٢', '3': '٣', '4': '٤',
-                    '5': '٥', '6': '٦', '7': '٧', '8': '٨', '9': '٩',
-                }
-                arabic_num = ''.join(arabic_digits[d] for d in prev_verse)
-                parts.append(f" ({arabic_num}) ")
-            parts.append(re.sub(r"</?rule[^>]*?>", "", word.text))
-            prev_verse = cur_verse
-        # Append the final verse number
-        if prev_verse is not None:
-            arabic_digits = {
-                '0': '٠', '1': '١', '2': '٢', '3': '٣', '4': '٤',
-                '5': '٥', '6': '٦', '7': '٧', '8': '٨', '9': '٩',
-            }
-            arabic_num = ''.join(arabic_digits[d] for d in prev_verse)
-            parts.append(f" ({arabic_num}) ")
+        for _, start, end in self._verse_runs:
+            words = self._words[start:end]
+            parts.extend([word.clean_text() for word in words])
+            # Arabic-Indic verse number in parentheses after each verse
+            parts.append(f" ({str(words[0].location.ayah_num).translate(_AR_DIGITS)}) ")
         return " ".join(parts)
 
     def phonemes_str(
@@ -225,44 +346,22 @@ class PhonemizeResult:
         • word_sep    – between words  (falls back to phoneme_sep if blank)
         • verse_sep   – between verses (falls back to word_sep → phoneme_sep if blank)
         """
-        parts: list[str] = []
-        prev_verse: str | None = None
-        prev_word:  str | None = None
-        have_prev_ph = False           # have we just emitted a phoneme?
-
-        def _add_sep(sep: str) -> None:
-            """Append a separator, avoiding consecutive duplicates."""
-            if sep and (not parts or parts[-1] != sep):
-                parts.append(sep)
-
-        for word in self._words:
-            cur_verse = str(word.location.ayah_num)
-            cur_word = str(word.location.word_num)
-
-            # -------- verse boundary --------------------------------------
-            if prev_verse is not None and cur_verse != prev_verse:
-                chosen = verse_sep if verse_sep else (word_sep if word_sep else phoneme_sep)
-                _add_sep(chosen)
-                have_prev_ph = False
-
-            # -------- word boundary ---------------------------------------
-            elif prev_word is not None and cur_word != prev_word:
-                chosen = word_sep if word_sep else phoneme_sep
-                _add_sep(chosen)
-                have_prev_ph = False
-
-            # -------- emit phonemes ---------------------------------------
-            for ph in word.get_phonemes():
-                if have_prev_ph:
-                    parts.append(phoneme_sep)
-                parts.append(str(ph))
-                have_prev_ph = True
-
-            prev_verse, prev_word = cur_verse, cur_word
-
-        return "".join(parts) or word_sep.join(
-            phoneme_sep.join(word) for word in self._nested
-        )
+        key = (phoneme_sep, word_sep, verse_sep)
+        cached = self._str_cache.get(key)
+        if cached is not None:
+            return cached
+
+        verse_chosen = verse_sep or word_sep or phoneme_sep
+        word_chosen = word_sep or phoneme_sep
+
+        # Words without phonemes contribute nothing, not an empty slot
+        # between two separators.
+        verses = [
+            word_chosen.join([phoneme_sep.join(phonemes) for phonemes in self._nested[start:end] if phonemes])
+            for _, start, end in self._verse_runs
+        ]
+        result = self._str_cache[key] = verse_chosen.join([verse for verse in verses if verse])
+        return result
 
     def show_table(self, phoneme_sep: str = "", split: Literal["word", "verse", "both"] = "word") -> "pd.DataFrame":
         """
@@ -278,63 +377,37 @@ class PhonemizeResult:
             raise ImportError("pandas is required for show_table(). Install with: pip install pandas")
         
         if split == "word":
-            rows = []
-            for word in self._words:
-                clean_word_text = re.sub(r"</?rule[^>]*?>", "", word.text)
-                phoneme_str = phoneme_sep.join(str(p) for p in word.get_phonemes())
-                rows.append({
-                    'location': word.location.location_key,
-                    'word': clean_word_text,
-                    'phonemes': phoneme_str,
-                })
-            rows.sort(key=lambda x: tuple(map(int, x['location'].split(':'))))
-            return pd.DataFrame(rows)
+            words, nested = self._in_location_order()
+            return pd.DataFrame({
+                'location': [word.location.location_key for word in words],
+                'word': [word.clean_text() for word in words],
+                'phonemes': [phoneme_sep.join(phonemes) for phonemes in nested],
+            })
 
         if split == "verse":
-            rows = []
-            current_key: str | None = None
-            current_text_parts: list[str] = []
-            current_list: list[str] = []
-            for word in self._words:
-                parts = word.location.location_key.split(":")
-                verse_key = ":".join(parts[:2])
-                if current_key is None:
-                    current_key = verse_key
-                if verse_key != current_key:
-                    rows.append({
-                        'location': current_key,
-                        'text': " ".join(current_text_parts),
-                        'phonemes': phoneme_sep.join(current_list),
-                    })
-                    current_key = verse_key
-                    current_text_parts = []
-                    current_list = []
-                current_text_parts.append(re.sub(r"</?rule[^>]*?>", "", word.text))
-                current_list.extend(str(p) for p in word.get_phonemes())
-            if current_key is not None:
-                rows.append({
-                    'location': current_key,
-                    'text': " ".join(current_text_parts),
-                    'phonemes': phoneme_sep.join(current_list),
-                })
-            rows.sort(key=lambda x: tuple(map(int, x['location'].split(':'))))
-            return pd.DataFrame(rows)
+            runs = self._verse_runs
+            if not self._is_sorted:
+                runs = sorted(runs, key=lambda run: self._words[run[1]].location.sort_key)
+            return pd.DataFrame({
+                'location': [verse_key for verse_key, _, _ in runs],
+                'text': [
+                    " ".join([word.clean_text() for word in self._words[start:end]])
+                    for _, start, end in runs
+                ],
+                'phonemes': [
+                    phoneme_sep.join(itertools.chain.from_iterable(self._nested[start:end]))
+                    for _, start, end in runs
+                ],
+            })
 
         if split == "both":
-            rows = []
-            for word in self._words:
-                parts = word.location.location_key.split(":")
-                verse_key = ":".join(parts[:2])
-                clean_word_text = re.sub(r"</?rule[^>]*?>", "", word.text)
-                phoneme_str = phoneme_sep.join(str(p) for p in word.get_phonemes())
-                rows.append({
-                    'verse': verse_key,
-                    'location': word.location.location_key,
-                    'word': clean_word_text,
-                    'phonemes': phoneme_str,
-                })
-            rows.sort(key=lambda x: tuple(map(int, x['location'].split(':'))))
-            return pd.DataFrame(rows)
+            words, nested = self._in_location_order()
+            return pd.DataFrame({
+                'verse': [word.location.verse_key for word in words],
+                'location': [word.location.location_key for word in words],
+                'word': [word.clean_text() for word in words],
+                'phonemes': [phoneme_sep.join(phonemes) for phonemes in nested],
+            })
 
         raise ValueError("split must be one of: 'word', 'verse', 'both'")
 
@@ -349,82 +422,46 @@ class PhonemizeResult:
         """
         path = Path(path)
 
-        def _clean_text(s: str) -> str:
-            return re.sub(r"</?rule[^>]*?>", "", s)
-
         if fmt == "json":
             # Build mappings: ref -> phoneme list(s), and ref -> text
             phoneme_map: dict[str, list] = {}
             text_map: dict[str, str] = {}
             if split == "word":
-                for word in self._words:
+                for word, phonemes in zip(self._words, self._nested):
                     ref_key = word.location.location_key  # s:v:w
-                    phoneme_map[ref_key] = [str(p) for p in word.get_phonemes()]
-                    text_map[ref_key] = _clean_text(word.text)
-            elif split == "verse":
-                current_key: str | None = None
-                current_list: list[str] = []
-                current_text_parts: list[str] = []
-                for word in self._words:
-                    parts = word.location.location_key.split(":")
-                    verse_key = ":".join(parts[:2])  # s:v
-                    if current_key is None:
-                        current_key = verse_key
-                    if verse_key != current_key:
-                        phoneme_map[current_key] = current_list
-                        text_map[current_key] = " ".join(current_text_parts)
-                        current_list = []
-                        current_text_parts = []
-                        current_key = verse_key
-                    current_list.extend(str(p) for p in word.get_phonemes())
-                    current_text_parts.append(_clean_text(word.text))
-                if current_key is not None:
-                    phoneme_map[current_key] = current_list
-                    text_map[current_key] = " ".join(current_text_parts)
-            elif split == "both":
-                current_key: str | None = None
-                current_list: list[list[str]] = []
-                current_text_parts: list[str] = []
-                for word in self._words:
-                    parts = word.location.location_key.split(":")
-                    verse_key = ":".join(parts[:2])  # s:v
-                    if current_key is None:
-                        current_key = verse_key
-                    if verse_key != current_key:
-                        phoneme_map[current_key] = current_list
-                        text_map[current_key] = " ".join(current_text_parts)
-                        current_list = []
-                        current_text_parts = []
-                        current_key = verse_key
-                    current_list.append([str(p) for p in word.get_phonemes()])
-                    current_text_parts.append(_clean_text(word.text))
-                if current_key is not None:
-                    phoneme_map[current_key] = current_list
-                    text_map[current_key] = " ".join(current_text_parts)
+                    phoneme_map[ref_key] = list(phonemes)
+                    text_map[ref_key] = word.clean_text()
+            elif split in ("verse", "both"):
+                for verse_key, start, end in self._verse_runs:
+                    verse_phonemes = self._nested[start:end]
+                    if split == "verse":
+                        phoneme_map[verse_key] = list(itertools.chain.from_iterable(verse_phonemes))
+                    else:
+                        phoneme_map[verse_key] = [list(phonemes) for phonemes in verse_phonemes]
+                    text_map[verse_key] = " ".join([word.clean_text() for word in self._words[start:end]])
             else:
                 raise ValueError("split must be one of: 'word', 'verse', 'both'")
 
-            # Manual formatting to keep each list on a single line
-            lines: list[str] = []
-            lines.append("{")
-            lines.append(f"  \"ref\": {json.dumps(self.ref, ensure_ascii=False)},")
-            lines.append(f"  \"text\": {json.dumps(self._text, ensure_ascii=False)},")
-            lines.append(f"  \"stops\": {json.dumps(self.stops, ensure_ascii=False)},")
-            lines.append("  \"texts\": {")
-            text_items = list(text_map.items())
-            for idx, (k, v) in enumerate(text_items):
-                comma = "," if idx < len(text_items) - 1 else ""
-                v_str = json.dumps(v, ensure_ascii=False)
-                lines.append(f"    \"{k}\": {v_str}{comma}")
-            lines.append("  },")
-            lines.append("  \"phonemes\": {")
-            items = list(phoneme_map.items())
-            for idx, (k, v) in enumerate(items):
-                comma = "," if idx < len(items) - 1 else ""
-                v_str = json.dumps(v, ensure_ascii=False, separators=(",", ":"))
-                lines.append(f"    \"{k}\": {v_str}{comma}")
-            lines.append("  }")
-            lines.append("}")
+            # Manual formatting to keep each list on a single line; leaf
+            # values go through the C encoder, only the framing is Python.
+            def _entries(mapping: dict) -> list[str]:
+                if not mapping:
+                    return []
+                return [",\n".join([f"    \"{k}\": {_json_compact(v)}" for k, v in mapping.items()])]
+
+            lines: list[str] = [
+                "{",
+                f"  \"ref\": {json.dumps(self.ref, ensure_ascii=False)},",
+                f"  \"text\": {json.dumps(self._text, ensure_ascii=False)},",
+                f"  \"stops\": {json.dumps(self.stops, ensure_ascii=False)},",
+                "  \"texts\": {",
+                *_entries(text_map),
+                "  },",
+                "  \"phonemes\": {",
+                *_entries(phoneme_map),
+                "  }",
+                "}",
+            ]
             path.write_text("\n".join(lines), encoding="utf-8")
         elif fmt == "csv":
             if split == "both":
@@ -434,28 +471,19 @@ class PhonemizeResult:
                 w = csv.writer(fh)
                 w.writerow(["ref", "text", "phoneme_seq"])
                 if split == "word":
-                    for word in self._words:
-                        ref_key = word.location.location_key  # s:v:w
-                        word_text = _clean_text(word.text)
-                        w.writerow([ref_key, word_text, " ".join(str(p) for p in word.get_phonemes())])
+                    w.writerows(
+                        (word.location.location_key, word.clean_text(), " ".join(phonemes))
+                        for word, phonemes in zip(self._words, self._nested)
+                    )
                 elif split == "verse":
-                    current_key: str | None = None
-                    current_text_parts: list[str] = []
-                    current_list: list[str] = []
-                    for word in self._words:
-                        parts = word.location.location_key.split(":")
-                        verse_key = ":".join(parts[:2])  # s:v
-                        if current_key is None:
-                            current_key = verse_key
-                        if verse_key != current_key:
-                            w.writerow([current_key, " ".join(current_text_parts), " ".join(current_list)])
-                            current_key = verse_key
-                            current_text_parts = []
-                            current_list = []
-                        current_text_parts.append(_clean_text(word.text))
-                        current_list.extend(str(p) for p in word.get_phonemes())
-                    if current_key is not None:
-                        w.writerow([current_key, " ".join(current_text_parts), " ".join(current_list)])
+                    w.writerows(
+                        (
+                            verse_key,
+                            " ".join([word.clean_text() for word in self._words[start:end]]),
+                            " ".join(itertools.chain.from_iterable(self._nested[start:end])),
+                        )
+                        for verse_key, start, end in self._verse_runs
+                    )
         else:
             raise ValueError(f"Unknown format: {fmt}")
         return path
\ No newline at end of file
@@ -8,31 +8,19 @@ from typing import Optional
 from .symbol import Symbol
 
 
-class DiacriticSymbol(Symbol):
-    def __init__(self, name: str, char: str, phoneme: Optional[str]):
-        super().__init__(name, char, phoneme)
-
-    @property
-    def is_sukun(self) -> bool:
-        return self.name == "SUKUN"
-
-    @property
-    def is_fatha(self) -> bool:
-        return self.name == "FATHA"
+_TANWEEN_NAMES = frozenset({"FATHATAN", "DAMMATAN", "KASRATAN"})
 
-    @property
-    def is_damma(self) -> bool:
-        return self.name == "DAMMA"
 
-    @property
-    def is_kasra(self) -> bool:
-        return self.name == "KASRA"
-
-    @property
-    def is_tanween(self) -> bool:
-        return self.name in ["FATHATAN", "DAMMATAN", "KASRATAN"]
+class DiacriticSymbol(Symbol):
+    # Diacritics are shared and never mutated, so the name checks are
+    # resolved once here rather than on every query
+    __slots__ = ("is_sukun", "is_fatha", "is_damma", "is_kasra", "is_tanween", "is_fathatan")
 
-    @property
-    def is_fathatan(self) -> bool:
-        return self.name == "FATHATAN"
-        
\ No newline at end of file
+    def __init__(self, name: str, char: str, phoneme: Optional[str]):
+        super().__init__(name, char, phoneme)
+        self.is_sukun: bool = name == "SUKUN"
+        self.is_fatha: bool = name == "FATHA"
+        self.is_damma: bool = name == "DAMMA"
+        self.is_kasra: bool = name == "KASRA"
+        self.is_tanween: bool = name in _TANWEEN_NAMES
+        self.is_fathatan: bool = name == "FATHATAN"
@@ -1,17 +1,21 @@
 from typing import List
 from .letter import LetterSymbol
 
+_LONG_VOWELS = frozenset({"a:", "u:", "i:"})
+
 class HamzaWasl(LetterSymbol):
+    __slots__ = ()
+
     def phonemize_letter(self) -> List[str]:
         if self.is_first and self.parent_word.is_starting:
             second_letter = self.next_letter(1)
-            third_letter = self.next_letter(2)
             
             # noun case
             if second_letter and second_letter.char == "ل":
                 return [self.base_phoneme, "a"]
             
             # verb case
+            third_letter = self.next_letter(2)
             if third_letter and third_letter.diacritic:
                 if third_letter.has_damma:
                     return [self.base_phoneme, "u"]
@@ -31,9 +35,11 @@ class HamzaWasl(LetterSymbol):
                 prev_letter.phonemes.append("i")
 
             # case 2
-            prev_phoneme = self.prev_phoneme()
-            if prev_phoneme in ["a:", "u:", "i:"]:
-                self.modify_prev_phoneme(prev_phoneme[0])
+            found = self.find_prev_phoneme_letter()
+            if found:
+                letter, phoneme_idx = found
+                if letter.phonemes[phoneme_idx] in _LONG_VOWELS:
+                    letter.phonemes[phoneme_idx] = letter.phonemes[phoneme_idx][0]
 
         # otherwise it is silent
         return []
@@ -3,7 +3,15 @@ from core.phoneme_registry import get_rule_phoneme
 from .letter import LetterSymbol
 from core.symbols.extension import ExtensionSymbol
 
+# Shared, never mutated (see letter.py)
+_DAGGER_ALEF = ExtensionSymbol("DAGGER_ALEF", "", None)
+
+# Vowels before the lam of the Name of Allah that make it heavy
+_HEAVY_LAM_PREV = frozenset({"a", "a:", "u"})
+
 class Lam(LetterSymbol):
+    __slots__ = ()
+
     ALLAH_LETTER_PATTERNS = {
         # always heavy
         'ءَآللَّهُ': ['ء', 'ا', 'ل', 'ل', 'ه'],
@@ -23,13 +31,15 @@ class Lam(LetterSymbol):
         'ٱللَّهُمَّ': ['ٱ', 'ل', 'ل', 'ه', 'م'],
         'ٱللَّهَ': ['ٱ', 'ل', 'ل', 'ه'],
     }
+    # Same patterns as hashable tuples, so a match is one set lookup
+    _ALLAH_LETTER_TUPLES = frozenset(tuple(p) for p in ALLAH_LETTER_PATTERNS.values())
     
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
     
     def phonemize_letter(self) -> List[str]:        
         if self._word_contains_Allah():
-            self.extension = ExtensionSymbol("DAGGER_ALEF", "", None)
+            self.extension = _DAGGER_ALEF
             if self.is_heavy:
                 return [get_rule_phoneme("lam_heavy", "phoneme")]
 
@@ -37,25 +47,15 @@ class Lam(LetterSymbol):
 
     @property
     def is_heavy(self) -> bool:
-        return self._word_contains_Allah() and self.prev_phoneme() in ["a", "a:", "u"]
+        return self._word_contains_Allah() and self.prev_phoneme() in _HEAVY_LAM_PREV
     
     def _word_contains_Allah(self) -> bool:
         if not self.has_shaddah or self.is_first:
             return False
 
-        word_letters = [letter.char for letter in self.parent_word.letters]
-        for pattern_letters in self.ALLAH_LETTER_PATTERNS.values():
-            if self._letters_match(word_letters, pattern_letters):
-                return True
-        
-        return False
-
-    def _letters_match(self, word_letters: List[str], pattern_letters: List[str]) -> bool:
-        if len(word_letters) != len(pattern_letters):
-            return False
-            
-        for word_letter, pattern_letter in zip(word_letters, pattern_letters):
-            if word_letter != pattern_letter:
-                return False
-                
-        return True
\ No newline at end of file
+        # Depends only on the word's letters, so it is computed once per word
+        word = self.parent_word
+        if word._contains_allah is None:
+            word_letters = tuple(letter.char for letter in word.letters)
+            word._contains_allah = word_letters in Lam._ALLAH_LETTER_TUPLES
+        return word._contains_allah
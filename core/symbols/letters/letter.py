@@ -5,7 +5,8 @@ Moved into core/symbols/letters/ directory.
 
 from __future__ import annotations
 
-from typing import List, Optional, final
+import sys
+from typing import Iterable, List, Optional, final
 
 from ..symbol import Symbol
 from ..diacritic import DiacriticSymbol
@@ -14,8 +15,31 @@ from ..other import OtherSymbol
 
 from core.phoneme_registry import get_rule_phoneme
 
+# Symbols substituted onto letters during phonemization. Symbols are never
+# mutated once built, so a single shared instance of each is enough.
+_STOP_FATHA = DiacriticSymbol("FATHA", "َ", "a")
+_STOP_SUKUN = DiacriticSymbol("SUKUN", "۟", None)
+_IMPLIED_EXTENSION = ExtensionSymbol("", "", None)
+
+
+def _char_set(chars: Iterable[str]) -> frozenset:
+    """Frozenset of interned characters; the parser interns letter chars too."""
+    return frozenset(sys.intern(char) for char in chars)
+
+
+_ALEF_CHARS = _char_set(["ا", "ى"])
+_HEAVY_CHARS = _char_set(["خ", "ص", "ض", "غ", "ط", "ق", "ظ"])
+_QALQALA_CHARS = _char_set(["ق", "ط", "ب", "ج", "د"])
+_IKHFAA_CHARS = _char_set(["ت", "ث", "ج", "د", "ذ", "ز", "س", "ش", "ص", "ض", "ط", "ظ", "ف", "ق", "ك"])
+_IDGHAM_GHUNNAH_CHARS = _char_set(["ي", "ن", "م", "و"])
+_IDGHAM_NO_GHUNNAH_CHARS = _char_set(["ل", "ر"])
+
 class LetterSymbol(Symbol):
     """Represents a consonant or vowel letter with associated diacritics, extensions, and other symbols."""
+    __slots__ = (
+        "parent_word", "index_in_word", "has_shaddah", "diacritic", "extension",
+        "other_symbols", "phonemes", "is_phonemized", "affected_by",
+    )
 
     def __init__(self, name: str, char: str, base_phoneme: str):
         super().__init__(name, char, base_phoneme)
@@ -43,24 +67,10 @@ class LetterSymbol(Symbol):
         Starts from the immediately previous letter and works backwards until a phoneme is found.
         Returns None if no previous phoneme is found.
         """
-        # Start with the current word
-        current_word = self.parent_word
-        current_index = self.index_in_word
-        
-        # Look at previous letters in the current word
-        while current_index > 0:
-            current_index -= 1
-            prev_letter = current_word.letters[current_index]
-            if prev_letter.phonemes and prev_letter.phonemes:
-                return prev_letter.phonemes[-1]  # Return the last phoneme of the previous letter
-        
-        # If no phoneme found in current word, check previous word
-        prev_word = current_word.prev_word
-        if prev_word:
-            for letter in reversed(prev_word.letters):
-                if letter.phonemes and letter.phonemes:
-                    return letter.phonemes[-1]  # Return the last phoneme
-
+        found = self.find_prev_phoneme_letter()
+        if found:
+            letter, phoneme_idx = found
+            return letter.phonemes[phoneme_idx]
         return None
         
     def find_prev_phoneme_letter(self) -> Optional[tuple["LetterSymbol", int]]:
@@ -69,22 +79,18 @@ class LetterSymbol(Symbol):
         Returns a tuple of (letter, phoneme_index) or None if no previous phoneme is found.
         This allows direct modification of the previous phoneme.
         """
-        # Start with the current word
-        current_word = self.parent_word
-        current_index = self.index_in_word
-        
         # Look at previous letters in the current word
-        while current_index > 0:
-            current_index -= 1
+        current_word = self.parent_word
+        for current_index in range(self.index_in_word - 1, -1, -1):
             prev_letter = current_word.letters[current_index]
-            if prev_letter.phonemes and prev_letter.phonemes:
+            if prev_letter.phonemes:
                 return (prev_letter, len(prev_letter.phonemes) - 1)  # Return letter and index of last phoneme
         
         # If no phoneme found in current word, check previous word
         prev_word = current_word.prev_word
-        if prev_word.letters:
+        if prev_word:
             for letter in reversed(prev_word.letters):
-                if letter.phonemes and letter.phonemes:
+                if letter.phonemes:
                     return (letter, len(letter.phonemes) - 1)  # Return letter and index of last phoneme
 
         return None
@@ -114,12 +120,12 @@ class LetterSymbol(Symbol):
         # change diacritics when stopping at a word
         if self.is_last and self.parent_word.is_stopping:
             if self.char == "ء" and self.has_fathatan:
-                self.diacritic = DiacriticSymbol("FATHA", "َ", "a")
+                self.diacritic = _STOP_FATHA
                 self.extend() # represents an alef
-            elif self.char in ["ى", "ا"]:
+            elif self.char in _ALEF_CHARS:
                 self.diacritic = None
             else:
-                self.diacritic = DiacriticSymbol("SUKUN", "۟", None)
+                self.diacritic = _STOP_SUKUN
         
         self.phonemes = self.phonemize_letter() + self.phonemize_modifiers()
         return self.phonemes
@@ -164,7 +170,7 @@ class LetterSymbol(Symbol):
         if not next_letter:
             return []
 
-        if next_letter.char in ["ا", "ى"]:
+        if next_letter.char in _ALEF_CHARS:
             if self.parent_word.is_stopping:
                 return [short_vowel_ph + ":"] # tanween becomes long vowel
             else:
@@ -192,7 +198,7 @@ class LetterSymbol(Symbol):
             return [short_vowel_ph]
 
         # Idgham no Ghunnah
-        if next_letter.char in ["ل", "ر"]:
+        if next_letter.is_idgham_no_ghunnah:
             return [short_vowel_ph]
 
         # Ith-har
@@ -203,7 +209,7 @@ class LetterSymbol(Symbol):
         
     def extend(self):
         if not self.extension:
-            self.extension = ExtensionSymbol("", "", None)
+            self.extension = _IMPLIED_EXTENSION
 
     @property
     def is_first(self) -> bool:
@@ -215,19 +221,23 @@ class LetterSymbol(Symbol):
 
     @property
     def is_heavy(self) -> bool:
-        return self.char in ["خ", "ص", "ض", "غ", "ط", "ق", "ظ"]
+        return self.char in _HEAVY_CHARS
 
     @property
     def is_qalqala(self) -> bool:
-        return self.char in ["ق", "ط", "ب", "ج", "د"]
+        return self.char in _QALQALA_CHARS
 
     @property
     def is_ikhfaa(self) -> bool:
-        return self.char in ["ت", "ث", "ج", "د", "ذ", "ز", "س", "ش", "ص", "ض", "ط", "ظ", "ف", "ق", "ك"]
+        return self.char in _IKHFAA_CHARS
 
     @property
     def is_idgham_ghunnah(self) -> bool:
-        return self.char in ["ي", "ن", "م", "و"]
+        return self.char in _IDGHAM_GHUNNAH_CHARS
+
+    @property
+    def is_idgham_no_ghunnah(self) -> bool:
+        return self.char in _IDGHAM_NO_GHUNNAH_CHARS
 
     @property
     def has_sukun(self) -> bool:
@@ -3,6 +3,8 @@ from .letter import LetterSymbol
 from core.phoneme_registry import get_rule_phoneme
 
 class Meem(LetterSymbol):
+    __slots__ = ()
+
     def phonemize_letter(self) -> List[str]:
         if self.has_shaddah:
             return [get_rule_phoneme("idgham", "nasalized_map").get("m")]
@@ -4,6 +4,8 @@ from .letter import LetterSymbol
 from core.phoneme_registry import get_rule_phoneme
 
 class Noon(LetterSymbol):
+    __slots__ = ()
+
     def phonemize_letter(self) -> List[str]:
         if self.has_shaddah:
             return [get_rule_phoneme("idgham", "nasalized_map").get("n")]
@@ -32,7 +34,7 @@ class Noon(LetterSymbol):
             return []
 
         # Idgham no Ghunnah
-        if next_letter.char in ["ل", "ر"]:
+        if next_letter.is_idgham_no_ghunnah:
             return []
         
         return [self.base_phoneme]
\ No newline at end of file
@@ -3,6 +3,8 @@ from .letter import LetterSymbol
 from core.phoneme_registry import get_rule_phoneme
 
 class Qalqala(LetterSymbol):
+    __slots__ = ()
+
     def phonemize_letter(self) -> List[str]:
         if self.has_sukun:
             # Qalqala Kubra
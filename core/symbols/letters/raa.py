@@ -3,6 +3,8 @@ from .letter import LetterSymbol
 from core.phoneme_registry import get_rule_phoneme
 
 class Raa(LetterSymbol):
+    __slots__ = ()
+
     def phonemize_letter(self) -> List[str]:
         prev = self.prev_letter()
         prev2 = self.prev_letter(2)
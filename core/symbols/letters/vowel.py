@@ -1,14 +1,27 @@
-from typing import List
+from typing import FrozenSet, List
 from .letter import LetterSymbol
 
+# Short vowels each long-vowel letter can lengthen (checked once per letter)
+_ALEF_COMPATIBLE = frozenset({"a", "aˤ"})
+_ALEF_MAKSURA_COMPATIBLE = frozenset({"a", "aˤ", "i"})
+_WAW_COMPATIBLE = frozenset({"a", "u"})
+_YAA_COMPATIBLE = frozenset({"i"})
+
 class VowelLetter(LetterSymbol):
-    def _lengthen_compatible_phoneme(self, compatible_phonemes: List[str]) -> List[str]:
-        prev_phoneme = self.prev_phoneme()
-        if prev_phoneme in compatible_phonemes:
-            self.modify_prev_phoneme(prev_phoneme + ":")
+    __slots__ = ()
+
+    def _lengthen_compatible_phoneme(self, compatible_phonemes: FrozenSet[str]) -> List[str]:
+        # One backwards walk serves both the check and the update
+        found = self.find_prev_phoneme_letter()
+        if found:
+            letter, phoneme_idx = found
+            if letter.phonemes[phoneme_idx] in compatible_phonemes:
+                letter.phonemes[phoneme_idx] += ":"
         return []
 
 class Alef(VowelLetter):
+    __slots__ = ()
+
     def phonemize_letter(self) -> List[str]:
         if self.has_symbol("SILENT_ALWAYS"):
             return []
@@ -16,17 +29,21 @@ class Alef(VowelLetter):
         if not self.parent_word.is_stopping and self.has_symbol("SILENT_AT_CONTINUATION"):
             return []  # e.g. أَنَا۠
 
-        return self._lengthen_compatible_phoneme(["a", "aˤ"])
+        return self._lengthen_compatible_phoneme(_ALEF_COMPATIBLE)
 
 class AlefMaksura(VowelLetter):
+    __slots__ = ()
+
     def phonemize_letter(self) -> List[str]:
         if self.diacritic or self.has_shaddah:
             # treat as Yaa
             return super().phonemize_letter()
         
-        return self._lengthen_compatible_phoneme(["a", "aˤ", "i"])
+        return self._lengthen_compatible_phoneme(_ALEF_MAKSURA_COMPATIBLE)
 
 class Waw(VowelLetter):
+    __slots__ = ()
+
     def phonemize_letter(self) -> List[str]:
         if self.has_symbol("SILENT_ALWAYS"):
             return []  # e.g. أُو۟لَـٰٓئِكَ
@@ -34,9 +51,11 @@ class Waw(VowelLetter):
         if self.diacritic:
             return super().phonemize_letter()
 
-        return self._lengthen_compatible_phoneme(["a", "u"])
+        return self._lengthen_compatible_phoneme(_WAW_COMPATIBLE)
 
 class Yaa(VowelLetter):
+    __slots__ = ()
+
     def phonemize_letter(self) -> List[str]:
         if self.has_symbol("SILENT_ALWAYS"):
             return []  # e.g. أَفَإِي۟ن
@@ -44,4 +63,4 @@ class Yaa(VowelLetter):
         if self.diacritic:
             return super().phonemize_letter()
 
-        return self._lengthen_compatible_phoneme(["i"])
\ No newline at end of file
+        return self._lengthen_compatible_phoneme(_YAA_COMPATIBLE)
\ No newline at end of file
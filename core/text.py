@@ -0,0 +1,34 @@
+"""
+Text helpers for the Quranic phonemizer.
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+
+def strip_rule_tags(text: str) -> str:
+    """
+    Remove ``<rule …>`` / ``</rule>`` wrappers, keeping interior letters.
+
+    Single left-to-right scan using ``str.find`` to jump between tags; text
+    without any tag is returned as-is, without copying.
+    """
+    lt = text.find("<")
+    if lt == -1:
+        return text
+
+    parts: List[str] = []
+    start = 0
+    while lt != -1:
+        gt = text.find(">", lt)
+        if gt == -1:
+            break
+        if text.startswith("rule", lt + 1) or text.startswith("/rule", lt + 1):
+            parts.append(text[start:lt])
+            start = gt + 1
+            lt = text.find("<", start)
+        else:
+            lt = text.find("<", lt + 1)
+    parts.append(text[start:])
+    return "".join(parts)
@@ -4,13 +4,20 @@ Word class for the Quranic phonemizer.
 
 from __future__ import annotations
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Sequence
 
 from .symbols.letters.letter import LetterSymbol
 from .location import Location
+from .text import strip_rule_tags
 from .symbols.stop import StopSymbol
 
 class Word:
+    __slots__ = (
+        "location", "text", "prev_word", "next_word", "letters", "phonemes",
+        "stop_sign", "is_starting", "is_stopping", "_clean_text",
+        "_contains_allah",
+    )
+
     def __init__(self, location: Location, text: str = ""):
         self.location = location
         self.text = text
@@ -21,6 +28,27 @@ class Word:
         self.stop_sign: Optional[StopSymbol] = None
         self.is_starting: bool = False  # True if this word is the start after a pause
         self.is_stopping: bool = False  # True if this word is paused at
+        self._clean_text: Optional[str] = None
+        self._contains_allah: Optional[bool] = None  # memo for Lam
+
+    def __getstate__(self) -> dict:
+        # Drop neighbour links so pickling a word does not recurse through the
+        # whole chain of words; link_words restores them (the parser after
+        # loading, PhonemizeResult after unpickling or copying).
+        state = {name: getattr(self, name) for name in self.__slots__}
+        state["prev_word"] = None
+        state["next_word"] = None
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def clean_text(self) -> str:
+        """Return the word text with rule tags removed (computed once)."""
+        if self._clean_text is None:
+            self._clean_text = strip_rule_tags(self.text)
+        return self._clean_text
 
     def get_prev_letter(self, index: int, n: int = 1) -> Optional[LetterSymbol]:
         """Get the previous letter in the current word or last letter of previous word."""
@@ -50,7 +78,7 @@ class Word:
         if self.phonemes: # special case for words that are phonemized already
             return
         
-        for i, letter in enumerate(self.letters):
+        for letter in self.letters:
             if letter.can_phonemize():
                 letter.phonemize()
 
@@ -60,48 +88,56 @@ class Word:
         
         phonemes = []
         for letter in self.letters:
-            phonemes.extend(ph for ph in letter.phonemes if ph)
+            if letter.phonemes: # skip silent / absorbed letters
+                phonemes.extend(ph for ph in letter.phonemes if ph)
         
         return phonemes
 
     def debug_print(self) -> str:
         """Pretty print for debugging purposes."""
-        result = f"Word at {self.location.location_key}:\n"
-        result += f"  Text: {self.text}\n"
+        parts = [f"Word at {self.location.location_key}:\n", f"  Text: {self.text}\n"]
+        add = parts.append
         if self.stop_sign:
-            result += f"  Stop Sign: {self.stop_sign.char} (name: {self.stop_sign.name})\n"
+            add(f"  Stop Sign: {self.stop_sign.char} (name: {self.stop_sign.name})\n")
         else:
-            result += "  Stop Sign: None\n"
+            add("  Stop Sign: None\n")
         
-        result += "  is_starting: " + str(self.is_starting) + "\n"
-        result += "  is_stopping: " + str(self.is_stopping) + "\n"
+        add(f"  is_starting: {self.is_starting}\n")
+        add(f"  is_stopping: {self.is_stopping}\n")
         
-        result += "  Letters:\n"
+        add("  Letters:\n")
         for i, letter in enumerate(self.letters):
-            result += f"    {i}: Letter '{letter.char}' -> {letter.base_phoneme}\n"
+            add(f"    {i}: Letter '{letter.char}' -> {letter.base_phoneme}\n")
             
             # Show sequential phonemization attributes
             if letter.phonemes:
-                result += f"      Phonemes: {letter.phonemes}\n"
+                add(f"      Phonemes: {letter.phonemes}\n")
             if letter.affected_by:
-                result += f"      Affected By: '{letter.affected_by.char}'\n"
+                add(f"      Affected By: '{letter.affected_by.char}'\n")
             
             # Show diacritic
             if letter.diacritic:
-                result += f"      Diacritic: '{letter.diacritic.char}' -> {letter.diacritic.base_phoneme} (name: {letter.diacritic.name})\n"
+                add(f"      Diacritic: '{letter.diacritic.char}' -> {letter.diacritic.base_phoneme} (name: {letter.diacritic.name})\n")
             
             # Show extension
             if letter.extension:
-                result += f"      Extension: '{letter.extension.char}' -> {letter.extension.base_phoneme} (name: {letter.extension.name})\n"
+                add(f"      Extension: '{letter.extension.char}' -> {letter.extension.base_phoneme} (name: {letter.extension.name})\n")
             
             # Show shaddah
             if letter.has_shaddah:
-                result += "      Shaddah\n"
+                add("      Shaddah\n")
             
             # Show other symbols
             if letter.other_symbols:
-                result += "      Other symbols:\n"
+                add("      Other symbols:\n")
                 for j, other in enumerate(letter.other_symbols):
-                    result += f"        {j}: '{other.char}' -> {other.base_phoneme} (name: {other.name})\n"
+                    add(f"        {j}: '{other.char}' -> {other.base_phoneme} (name: {other.name})\n")
         
-        return result
+        return "".join(parts)
+
+
+def link_words(words: Sequence[Word]) -> None:
+    """Link consecutive words through their ``prev_word`` / ``next_word``."""
+    for prev_word, next_word in zip(words, words[1:]):
+        prev_word.next_word = next_word
+        next_word.prev_word = prev_word